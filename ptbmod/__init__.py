@@ -1,18 +1,26 @@
-from datetime import datetime
+import logging
 
 from .__version__ import __version__
 
-__copyright__ = (
-    f"Copyright {datetime.now().year} AshokShau <github.com/AshokShau>"
-)
+logging.getLogger(__name__).info("PtbMod Version: %s", __version__)
+
+
+def __getattr__(name: str):
+    # Build the copyright string only when it is actually read (PEP 562)
+    if name == "__copyright__":
+        import time
+
+        return f"Copyright {time.gmtime().tm_year} AshokShau <github.com/AshokShau>"
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-print(f"PtbMod Version: {__version__}\nCopyright: {__copyright__}")
 
 from .decorator import TelegramHandler
-from .decorator import verifyAnonymousAdmin, Admins
+from .decorator import verifyAnonymousAdmin, verify_anonymous_admin, Admins, ANON_PATTERN
 
 __all__ = [
     "TelegramHandler",
     "verifyAnonymousAdmin",
+    "verify_anonymous_admin",
     "Admins",
+    "ANON_PATTERN",
 ]
@@ -1,16 +1,39 @@
+from functools import lru_cache
 from os import getenv
+from types import SimpleNamespace
 
 from dotenv import load_dotenv
 
-load_dotenv()
 
-
-class Config:
-    HANDLER: list[str] = getenv("HANDLER", "/ !").split()
+@lru_cache(maxsize=1)
+def _load() -> SimpleNamespace:
+    """
+    Load the environment once and build the configuration values.
+    """
+    load_dotenv()
+    devs: frozenset[int] = frozenset()
     devs_env = getenv("DEVS")
-    DEVS: list[int] = []
     if devs_env:
         try:
-            DEVS = list(map(int, devs_env.split()))
+            devs = frozenset(map(int, devs_env.split()))
         except ValueError:
             print("Warning: Some values in DEVS could not be converted to integers.")
+    return SimpleNamespace(
+        HANDLER=getenv("HANDLER", "/ !").split(),
+        DEVS=devs,
+    )
+
+
+class _Config:
+    """
+    Lazily evaluated configuration; the environment is read on first attribute access.
+    """
+
+    def __getattr__(self, name: str):
+        value = getattr(_load(), name)
+        # Store on the instance so later lookups skip __getattr__ entirely
+        setattr(self, name, value)
+        return value
+
+
+Config = _Config()
@@ -1,11 +1,14 @@
-from .admins import Admins, verifyAnonymousAdmin
+from .admins import ANON_PATTERN, Admins, verifyAnonymousAdmin, verify_anonymous_admin
 from .command import TelegramHandler
-from .handlers import NewCommandHandler, NewMessageHandler
+from .handlers import CommandRouter, NewCommandHandler, NewMessageHandler
 
 __all__ = [
     "TelegramHandler",
     "NewCommandHandler",
+    "CommandRouter",
     "NewMessageHandler",
     "Admins",
+    "ANON_PATTERN",
     "verifyAnonymousAdmin",
+    "verify_anonymous_admin",
 ]
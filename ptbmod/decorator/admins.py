@@ -1,67 +1,186 @@
+import asyncio
+import re
 from collections.abc import Callable
 from functools import wraps, partial
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Optional, Union, Any
 
-from telegram import Update, Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
+from telegram import (
+    Update,
+    Message,
+    ChatMember,
+    InlineKeyboardMarkup,
+    InlineKeyboardButton,
+)
 from telegram.constants import ChatID, ChatType
 from telegram.ext import ContextTypes
 
-from .cache import get_admin_cache_user, is_admin, is_owner, load_admin_cache
+from .cache import OWNER, get_admin_cache_user, is_owner_sync, load_admin_cache, role_bits
 from ..config import Config
 
+# Callback data of the "Verify Admin" button; register verifyAnonymousAdmin with this pattern
+ANON_PATTERN = re.compile(r"^anon\.(\d+)$")
 
-def ensure_permissions_list(permissions: Union[str, list[str]]) -> list[str]:
+# Reply templates used by Admins
+_MSG_ONLY_DEVS = "Only developers can use this command."
+_MSG_ONLY_GROUPS = "This command can only be used in groups."
+_MSG_ONLY_OWNER = "Only the chat owner can use this command."
+_MSG_VERIFY_ANON = "Please verify that you are an admin to perform this action."
+_MSG_ADMIN_REQUIRED = "I need to be an admin to do this."
+_MSG_USER_ADMIN = "You need to be an admin to do this."
+_MSG_BOT_PERMS = "I don't have permission to {perms}."
+_MSG_USER_PERMS = "You don't have permission to {perms}."
+
+# Read-only mapping of ChatMemberAdministrator permission attributes to readable names
+PERMISSION_ERROR_MESSAGES = MappingProxyType({
+    "can_change_info": "change group info",
+    "can_delete_messages": "delete messages",
+    "can_delete_stories": "delete stories",
+    "can_edit_messages": "edit messages",
+    "can_edit_stories": "edit stories",
+    "can_invite_users": "invite users",
+    "can_manage_chat": "manage the chat",
+    "can_manage_topics": "manage topics",
+    "can_manage_video_chats": "manage video chats",
+    "can_pin_messages": "pin messages",
+    "can_post_messages": "post messages",
+    "can_post_stories": "post stories",
+    "can_promote_members": "promote members",
+    "can_restrict_members": "restrict members",
+})
+
+
+def ensure_permissions_list(permissions: Optional[Union[str, list[str]]]) -> tuple[str, ...]:
     """
-    Ensures permissions are a list of strings.
+    Ensures permissions are a tuple of strings.
     """
+    if permissions is None:
+        return ()
     if isinstance(permissions, str):
-        return [permissions]
-    return permissions or []
+        return (permissions,)
+    return tuple(permissions)
 
 
-async def check_permissions(chat_id: int, user_id: int, permissions: Union[str, list[str]]) -> bool:
+def compile_permissions(permissions: tuple[str, ...]) -> Optional[attrgetter]:
     """
-    Check if a user has specific permissions.
+    Build a single accessor that reads all the given permission attributes at once.
     """
-    if await is_owner(chat_id, user_id):
+    return attrgetter(*permissions) if permissions else None
+
+
+def has_permissions(
+        member: Optional[ChatMember],
+        permissions: tuple[str, ...],
+        getter: Optional[attrgetter] = None,
+) -> bool:
+    """
+    Check if a cached chat member is an admin holding all the given permissions.
+    """
+    role = role_bits(member)
+    if role & OWNER:
         return True
 
-    if not await is_admin(chat_id, user_id):
+    if not role:
         return False
 
-    permissions = ensure_permissions_list(permissions)
     if not permissions:
         return True
 
-    _, user_info = await get_admin_cache_user(chat_id, user_id)
-    if not user_info:
+    if getter is None:
+        getter = attrgetter(*permissions)
+    try:
+        values = getter(member)
+    except AttributeError:
+        # Unknown permission names are treated as missing
         return False
+    if len(permissions) == 1:
+        return bool(values)
+    return all(values)
 
-    return all(getattr(user_info, perm, False) for perm in permissions)
+
+def get_missing_permissions(
+        member: Optional[ChatMember],
+        permissions: tuple[str, ...],
+        getter: Optional[attrgetter] = None,
+) -> tuple[str, ...]:
+    """
+    Return the given permissions that a cached admin member does not hold.
+    """
+    if not permissions or role_bits(member) & OWNER:
+        return ()
+
+    if getter is None:
+        getter = attrgetter(*permissions)
+    try:
+        values = getter(member)
+    except AttributeError:
+        # Unknown permission names are treated as missing
+        values = tuple(getattr(member, perm, False) for perm in permissions)
+    else:
+        if len(permissions) == 1:
+            values = (values,)
+    return tuple(perm for perm, value in zip(permissions, values) if not value)
+
+
+async def check_permissions(
+        chat_id: int,
+        user_id: int,
+        permissions: Union[str, list[str]],
+        getter: Optional[attrgetter] = None,
+) -> bool:
+    """
+    Check if a user has specific permissions.
+
+    A getter built by compile_permissions for the same permissions can be passed
+    to avoid rebuilding it on every call.
+    """
+    _, user_info = await get_admin_cache_user(chat_id, user_id)
+    return has_permissions(user_info, ensure_permissions_list(permissions), getter)
 
 
 async def verifyAnonymousAdmin(
         update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> Optional[Union[Message, bool]]:
     callback = update.callback_query
-    callback_id = int(f"{callback.message.chat.id}{callback.data.split('.')[1]}")
-    message, func, permissions = context.bot_data.pop(callback_id, (None, None, None))
+    # Reuse PTB's match only for ANON_PATTERN; other patterns (such as the older
+    # r"^anon.") may have no capture group, so parse the callback data instead
+    match = context.matches[0] if context.matches else None
+    if match is not None and match.re is ANON_PATTERN:
+        message_id = match.group(1)
+    else:
+        message_id = callback.data.partition('.')[2]
+    callback_id = (callback.message.chat.id, int(message_id))
+    func, permissions = context.bot_data.pop(callback_id, (None, None))
 
-    if not message:
-        await callback.answer("Failed to get message", show_alert=True)
-        await callback.delete_message()
+    if func is None:
+        await asyncio.gather(
+            callback.answer("Failed to get message", show_alert=True),
+            callback.delete_message(),
+        )
         return
 
-    if not await check_permissions(message.chat.id, callback.from_user.id, permissions):
-        await callback.answer("You don't have the required permissions.", show_alert=True)
-        await callback.delete_message()
+    if not await check_permissions(callback.message.chat.id, callback.from_user.id, permissions):
+        await asyncio.gather(
+            callback.answer("You don't have the required permissions.", show_alert=True),
+            callback.delete_message(),
+        )
         return
 
-    try:
-        await callback.delete_message()
-        await func(update, context)
-    except Exception as e:
-        raise e
+    await callback.delete_message()
+    await func(update, context)
+
+
+verify_anonymous_admin = verifyAnonymousAdmin
+
+
+def _verify_keyboard(message_id: int) -> InlineKeyboardMarkup:
+    """
+    Build the keyboard used to ask an anonymous admin to verify themselves.
+    """
+    return InlineKeyboardMarkup(
+        [[InlineKeyboardButton(text="Verify Admin", callback_data=f"anon.{message_id}")]]
+    )
 
 
 def Admins(
@@ -78,6 +197,21 @@ def Admins(
     Decorator to check if a specific user or bot has required permissions.
     """
     permissions = ensure_permissions_list(permissions)
+    permissions_getter = compile_permissions(permissions)
+    # Readable name per declared permission, resolved once at decoration time
+    permission_names = {perm: PERMISSION_ERROR_MESSAGES.get(perm, perm) for perm in permissions}
+    # Developer-only commands with no admin gates never need the admin cache
+    devs_only = only_devs and not (permissions or is_bot or is_user or is_both or only_owner)
+    # Subjects to check in order (True for the bot, False for the user); the checks are
+    # local cache reads, so they run one after another and stop at the first failure
+    subjects = tuple(dict.fromkeys(
+        ((True,) if is_bot else ()) + ((False,) if is_user else ()) + ((False, True) if is_both else ())
+    ))
+    # Replies per subject: (not an admin, missing permissions template)
+    errors = {
+        True: (_MSG_ADMIN_REQUIRED, _MSG_BOT_PERMS),
+        False: (_MSG_USER_ADMIN, _MSG_USER_PERMS),
+    }
 
     def wrapper(func):
         @wraps(func)
@@ -87,60 +221,61 @@ def Admins(
             chat_id = update.effective_chat.id
             bot_id = context.bot.id
             message = update.effective_message
-            sender = partial(update.callback_query.answer, show_alert=True) if isinstance(update.callback_query,
-                                                                                          CallbackQuery) else message.reply_text
+            callback = update.callback_query
+            if callback is not None:
+                sender = partial(callback.answer, show_alert=True)
+            else:
+                sender = message.reply_text
 
             if only_devs and user_id not in Config.DEVS:
                 if no_reply:
                     return None
-                return await sender("Only developers can use this command.")
+                return await sender(_MSG_ONLY_DEVS)
 
             if not allow_pm and update.effective_chat.type == ChatType.PRIVATE:
                 if no_reply:
                     return None
-                return await sender("This command can only be used in groups.")
+                return await sender(_MSG_ONLY_GROUPS)
+
+            if devs_only:
+                return await func(update, context, *args, **kwargs)
 
             load, _ = await load_admin_cache(context.bot, chat_id)
             if not load:
                 if no_reply:
                     return None
-                return await sender("I need to be an admin to do this.")
+                return await sender(_MSG_ADMIN_REQUIRED)
 
             if message.from_user.id == ChatID.ANONYMOUS_ADMIN and not no_reply:
-                context.bot_data[int(f"{message.chat.id}{message.id}")] = (message, func, permissions)
-                keyboard = InlineKeyboardMarkup(
-                    [[InlineKeyboardButton(text="Verify Admin", callback_data=f"anon.{message.id}")]])
+                # Keep only what verification needs, not the whole Message object graph
+                context.bot_data[(message.chat.id, message.id)] = (func, permissions)
                 return await message.reply_text(
-                    "Please verify that you are an admin to perform this action.",
-                    reply_markup=keyboard,
+                    _MSG_VERIFY_ANON,
+                    reply_markup=_verify_keyboard(message.id),
                 )
 
-            if only_owner and not await is_owner(chat_id, user_id):
+            if only_owner and not is_owner_sync(chat_id, user_id):
                 if no_reply:
                     return None
-                return await sender("Only the chat owner can use this command.")
-
-            async def check_and_notify(subject_id, subject_name) -> Optional[bool]:
-                if not await is_admin(chat_id, subject_id):
-                    if no_reply:
-                        return None
-                    await sender(f"{subject_name} needs to be an admin.")
-                    return False
-
-                if not await check_permissions(chat_id, subject_id, permissions):
-                    if no_reply:
-                        return None
-                    await sender(f"{subject_name} lacks required permissions: {', '.join(permissions)}.")
-                    return False
-                return True
-
-            if is_bot and not await check_and_notify(bot_id, "I"):
-                return None
-            if is_user and not await check_and_notify(user_id, "You"):
+                return await sender(_MSG_ONLY_OWNER)
+
+            for check_bot in subjects:
+                # One cache probe serves both the admin and the permission checks
+                _, member = await get_admin_cache_user(chat_id, bot_id if check_bot else user_id)
+                if not role_bits(member):
+                    error = errors[check_bot][0]
+                elif not has_permissions(member, permissions, permissions_getter):
+                    # Name only what the subject actually lacks, not every declared permission
+                    missing = get_missing_permissions(member, permissions, permissions_getter)
+                    error = errors[check_bot][1].format(
+                        perms=", ".join(permission_names[perm] for perm in missing)
+                    )
+                else:
+                    continue
+
+                if not no_reply:
+                    await sender(error)
                 return None
-            if is_both:
-                if not await check_and_notify(user_id, "You") or not await check_and_notify(bot_id, "I"):
-                    return None
 
             return await func(update, context, *args, **kwargs)
 
@@ -1,42 +1,247 @@
-from typing import Optional, Tuple, List
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, List
 
-from cachetools import TTLCache
-from telegram import ChatMember, ChatMemberOwner, ChatMemberAdministrator, Bot
+from telegram import ChatMember, Bot
+from telegram.constants import ChatMemberStatus
+from telegram.error import TelegramError
 
-# Initialize TTLCache with a max size and TTL (Time-to-live)
-admin_cache = TTLCache(maxsize=1000, ttl=15 * 60)  # 16 minutes TTL
+log = logging.getLogger(__name__)
+
+
+class ExpiringCache:
+    """
+    A minimal dict-backed cache whose entries expire after a fixed TTL.
+
+    Entries are stored as (expires_at, value, size) and checked on read. Expired entries
+    are pruned every few writes, and the oldest writes are evicted once the total size
+    exceeds maxsize. It takes no locks; it is only touched from the event loop thread.
+    """
+
+    __slots__ = ("_data", "_ttl", "_maxsize", "_getsizeof", "_size", "_writes")
+
+    # Prune expired entries after this many writes
+    _PRUNE_EVERY = 256
+
+    def __init__(self, maxsize: int, ttl: float, getsizeof: Optional[Callable[[Any], int]] = None):
+        self._data: Dict[Any, Tuple[float, Any, int]] = {}
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._getsizeof = getsizeof
+        self._size = 0
+        self._writes = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > monotonic():
+            return entry[1]
+        return default
+
+    def expires_at(self, key: Any) -> Optional[float]:
+        """
+        Return the monotonic time at which the entry for key expires, if present.
+        """
+        entry = self._data.get(key)
+        return entry[0] if entry is not None else None
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        self._size -= entry[2]
+        return entry[1] if entry[0] > monotonic() else default
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._size = 0
+
+    def __getitem__(self, key: Any) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= monotonic():
+            raise KeyError(key)
+        return entry[1]
+
+    def __delitem__(self, key: Any) -> None:
+        entry = self._data.get(key)
+        if entry is None:
+            raise KeyError(key)
+        del self._data[key]
+        self._size -= entry[2]
+        if entry[0] <= monotonic():
+            raise KeyError(key)  # Already expired, as with a missing key
+
+    def __contains__(self, key: Any) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > monotonic()
+
+    def __iter__(self) -> Iterator[Any]:
+        now = monotonic()
+        return iter([key for key, entry in self._data.items() if entry[0] > now])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        size = self._getsizeof(value) if self._getsizeof is not None else 1
+        self.pop(key)
+        self._data[key] = (monotonic() + self._ttl, value, size)
+        self._size += size
+        self._writes += 1
+        if self._size > self._maxsize or not self._writes % self._PRUNE_EVERY:
+            self._prune()
+
+    def __len__(self) -> int:
+        # Count only live entries, consistent with get() and `in`
+        now = monotonic()
+        return sum(1 for entry in self._data.values() if entry[0] > now)
+
+    def _prune(self) -> None:
+        now = monotonic()
+        for key in [key for key, entry in self._data.items() if entry[0] <= now]:
+            self._size -= self._data.pop(key)[2]
+        # Still over the limit: evict the oldest writes first
+        while self._size > self._maxsize and self._data:
+            self._size -= self._data.pop(next(iter(self._data)))[2]
+
+
+# Entries are weighted by admin count, so maxsize bounds cached members rather than chats.
+admin_cache = ExpiringCache(
+    maxsize=50_000,
+    ttl=15 * 60,  # 15 minutes TTL
+    getsizeof=lambda entry: len(entry.user_info) + 1,
+)
+# Chats whose admin list recently failed to load, so failures aren't retried on every update
+admin_neg_cache = ExpiringCache(maxsize=1000, ttl=30)  # 30 seconds TTL
+
+# Seconds before expiry at which a cache hit triggers a background refresh
+_REFRESH_AHEAD = 60
+
+# Sentinel for cache lookups, distinct from any stored value
+_MISS = object()
+
+# Admin list requests currently in flight, so concurrent misses share one API call
+_inflight: Dict[int, "asyncio.Task[tuple[bool, AdminCache]]"] = {}
+
+# Role bits returned by role_bits; an owner is always an admin as well
+OWNER = 1
+ADMIN = 2
+_STATUS_BITS = {
+    ChatMemberStatus.OWNER: OWNER | ADMIN,
+    ChatMemberStatus.ADMINISTRATOR: ADMIN,
+}
+
+
+def role_bits(member: Optional[ChatMember]) -> int:
+    """
+    Return the role of a chat member as a bitmask of OWNER and ADMIN.
+    """
+    return _STATUS_BITS.get(member.status, 0) if member is not None else 0
 
 
 class AdminCache:
+    __slots__ = ("chat_id", "user_info", "cached", "user_map", "owner_ids", "admin_ids")
+
     def __init__(self, chat_id: int, user_info: List[ChatMember], cached: bool = True):
         self.chat_id = chat_id
         self.user_info = user_info
         self.cached = cached
+        # Index by user id once so lookups are a single dict probe
+        self.user_map: Dict[int, ChatMember] = {member.user.id: member for member in user_info}
+        # Role lookups reduce to a set membership test
+        self.owner_ids = frozenset(uid for uid, member in self.user_map.items() if role_bits(member) & OWNER)
+        self.admin_ids = frozenset(uid for uid, member in self.user_map.items() if role_bits(member) & ADMIN)
 
     def get_user_info(self, user_id: int) -> Optional[ChatMember]:
-        return next((user for user in self.user_info if user.user.id == user_id), None)
+        return self.user_map.get(user_id)
 
 
 async def load_admin_cache(bot: Bot, chat_id: int, force_reload: bool = False) -> tuple[bool, AdminCache]:
     """
     Load the admin list from Telegram and cache it, unless already cached.
     Set force_reload to True to bypass the cache and reload the admin list.
+    Concurrent loads for the same chat share a single request; a forced reload only
+    shares requests that started after it was called.
     """
-    # Check if the cache is already populated for the chat_id
-    if not force_reload and chat_id in admin_cache:
-        return True, admin_cache[chat_id]  # Return the cached data if available and reload not forced
+    # Check if the cache is already populated for the chat_id, with a single lookup
+    cached = _MISS if force_reload else admin_cache.get(chat_id, _MISS)
+    if cached is not _MISS:
+        # Close to expiry: refresh in the background so no caller waits on a cold miss
+        # Skip it while a refresh is running or one recently failed (e.g. during a flood-wait)
+        if (
+                admin_cache.expires_at(chat_id) - monotonic() < _REFRESH_AHEAD
+                and chat_id not in _inflight
+                and chat_id not in admin_neg_cache
+        ):
+            _start_fetch(bot, chat_id).add_done_callback(
+                lambda done: _refresh_done(chat_id, done)
+            )
+        return True, cached  # Return the cached data if available and reload not forced
 
+    if not force_reload and chat_id in admin_neg_cache:
+        return False, AdminCache(chat_id, [], cached=False)  # Failed recently; don't retry yet
+
+    if force_reload:
+        pending = _inflight.get(chat_id)
+        if pending is not None:
+            # That request started before this call and may return a stale list; let it
+            # finish (so it can't overwrite the reload) and then fetch again. Any request
+            # in flight after this point started after the forced call, so it can be shared.
+            await asyncio.wait((pending,))
+
+    # Shield the shared request so one cancelled caller doesn't cancel it for the others
+    return await asyncio.shield(_start_fetch(bot, chat_id))
+
+
+def _start_fetch(bot: Bot, chat_id: int) -> "asyncio.Task[tuple[bool, AdminCache]]":
+    """
+    Return the in-flight admin list request for a chat, starting one if there is none.
+    """
+    task = _inflight.get(chat_id)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_admin_cache(bot, chat_id))
+        _inflight[chat_id] = task
+        task.add_done_callback(lambda done: _forget_inflight(chat_id, done))
+    return task
+
+
+async def _fetch_admin_cache(bot: Bot, chat_id: int) -> tuple[bool, AdminCache]:
+    """
+    Retrieve the admin list from Telegram and store it in the cache.
+    """
     try:
         # Retrieve and cache the admin list
         admin_list = list(await bot.get_chat_administrators(chat_id))
-        admin_cache[chat_id] = AdminCache(chat_id, admin_list)
-        return True, admin_cache[chat_id]
-    except Exception as e:
-        print(f"Error loading admin cache for chat_id {chat_id}: {e}")
+        entry = admin_cache[chat_id] = AdminCache(chat_id, admin_list)
+        admin_neg_cache.pop(chat_id, None)
+        return True, entry
+    except TelegramError as e:
+        log.warning("Error loading admin cache for chat_id %s", chat_id, exc_info=e)
+        admin_neg_cache[chat_id] = True
         # Return an empty AdminCache with `cached=False` if there was an error
         return False, AdminCache(chat_id, [], cached=False)
 
 
+def _forget_inflight(chat_id: int, task: asyncio.Task) -> None:
+    """
+    Drop a finished request from the in-flight map, unless it was already replaced.
+    """
+    if _inflight.get(chat_id) is task:
+        del _inflight[chat_id]
+
+
+def _refresh_done(chat_id: int, task: asyncio.Task) -> None:
+    """
+    Retrieve the outcome of a background refresh that nobody awaits.
+
+    TelegramError is already handled by _fetch_admin_cache; anything else is logged
+    here and negative-cached so the next hits don't retry straight away.
+    """
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        log.warning("Background admin cache refresh failed for chat_id %s", chat_id, exc_info=error)
+        admin_neg_cache[chat_id] = True
+
+
 async def get_admin_cache_user(chat_id: int, user_id: int) -> Tuple[bool, Optional[ChatMember]]:
     """
     Check if the user is an admin using cached data.
@@ -45,28 +250,42 @@ async def get_admin_cache_user(chat_id: int, user_id: int) -> Tuple[bool, Option
     if admin_list is None:
         return False, None  # Cache miss; admin list not available
 
-    for user_info in admin_list.user_info:
-        if user_info.user.id == user_id:
-            return True, user_info  # User is an admin in the cached list
+    user_info = admin_list.user_map.get(user_id)
+    if user_info is None:
+        return False, None  # User is not found in the cached admin list
+
+    return True, user_info  # User is an admin in the cached list
+
+
+def is_owner_sync(chat_id: int, user_id: int) -> bool:
+    """
+    Check if the user is the owner of the chat, without awaiting.
+    """
+    entry = admin_cache.get(chat_id)
+    return entry is not None and user_id in entry.owner_ids
 
-    return False, None  # User is not found in the cached admin list
+
+def is_admin_sync(chat_id: int, user_id: int) -> bool:
+    """
+    Check if the user is an admin (including the owner) in the chat, without awaiting.
+    """
+    entry = admin_cache.get(chat_id)
+    return entry is not None and user_id in entry.admin_ids
 
 
 async def is_owner(chat_id: int, user_id: int) -> bool:
     """
     Check if the user is the owner of the chat.
+
+    Kept for compatibility; new code should call is_owner_sync.
     """
-    is_cached, user_info = await get_admin_cache_user(chat_id, user_id)
-    if is_cached and isinstance(user_info, ChatMemberOwner):
-        return True  # User is the owner of the chat in cached data
-    return False
+    return is_owner_sync(chat_id, user_id)
 
 
 async def is_admin(chat_id: int, user_id: int) -> bool:
     """
     Check if the user is an admin (including the owner) in the chat.
+
+    Kept for compatibility; new code should call is_admin_sync.
     """
-    is_cached, user_info = await get_admin_cache_user(chat_id, user_id)
-    if is_cached and (isinstance(user_info, ChatMemberAdministrator) or isinstance(user_info, ChatMemberOwner)):
-        return True  # User is an admin or owner in the cached data
-    return False
+    return is_admin_sync(chat_id, user_id)
@@ -1,12 +1,29 @@
-from typing import Any, Callable, List, Optional, Pattern, Union
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
 
 from telegram.ext import Application, CallbackQueryHandler, ChatMemberHandler, InlineQueryHandler
 from telegram.ext import filters as filters_module
 from telegram.ext.filters import BaseFilter
 
+from .handlers import CommandRouter
 from .handlers import NewCommandHandler as CommandHandler
 from .handlers import NewMessageHandler as MessageHandler
 
+# Shared "not an edit" filter, built once instead of per decorated command
+_NO_EDIT = ~filters_module.UpdateType.EDITED_MESSAGE
+# filters & _NO_EDIT per filter object, so decorators sharing a filter reuse the result.
+# The filter itself is kept in the value so its id() can't be reused while cached.
+_no_edit_filters: Dict[int, Tuple[BaseFilter, BaseFilter]] = {}
+
+
+def _without_edits(filters: BaseFilter) -> BaseFilter:
+    """
+    Combine a filter with _NO_EDIT, reusing the result for the same filter object.
+    """
+    cached = _no_edit_filters.get(id(filters))
+    if cached is None:
+        cached = _no_edit_filters[id(filters)] = (filters, filters & _NO_EDIT)
+    return cached[1]
+
 
 class TelegramHandler:
     """
@@ -23,16 +40,40 @@ class TelegramHandler:
             application: The Telegram Application to add the handlers to.
         """
         self.app = application
+        # Latest CommandRouter per (group, block), shared by consecutively registered commands
+        self._routers: Dict[Tuple[int, Optional[bool]], CommandRouter] = {}
+
+    def _router(self, group: int, block: Optional[bool]) -> CommandRouter:
+        """
+        Get the CommandRouter for a group, adding a new one to the Application when needed.
+
+        A router is only reused while it is still the last handler of its group, so commands
+        keep their place relative to other handlers registered in between, and PTB's
+        "first matching handler in a group wins" order is unchanged.
+
+        Args:
+            group: The group the router handles commands for.
+            block: Whether the router should block other handlers from being called.
+
+        Returns:
+            The CommandRouter for the given group and block setting.
+        """
+        router = self._routers.get((group, block))
+        group_handlers = self.app.handlers.get(group)
+        if router is None or not group_handlers or group_handlers[-1] is not router:
+            router = self._routers[(group, block)] = CommandRouter(block=block)
+            self.app.add_handler(router, group)
+        return router
 
     def command(
             self,
-            command: List[str],
+            command: Union[str, List[str], Tuple[str, ...]],
             filters: Optional[filters_module.BaseFilter] = None,
             block: Optional[bool] = True,
             has_args: Optional[Union[bool, int]] = None,
             group: Optional[int] = 0,
             allow_edit: Optional[Union[bool, bool]] = False,
-            prefix: Optional[List[str]] = None,
+            prefix: Optional[Union[List[str], Tuple[str, ...]]] = None,
     ) -> Callable[[Any], None]:
         """
         A decorator to add a CommandHandler to the Telegram Application.
@@ -53,16 +94,17 @@ class TelegramHandler:
         if allow_edit:
             filters = filters
         elif filters:
-            filters = filters & ~filters_module.UpdateType.EDITED_MESSAGE
+            filters = _without_edits(filters)
         else:
-            filters = ~filters_module.UpdateType.EDITED_MESSAGE
+            filters = _NO_EDIT
 
         def _command(func) -> None:
             """
             A decorator to add a CommandHandler to the Telegram Application.
 
-            This function adds the CommandHandler to the Telegram Application. The CommandHandler
-            is created with the given command, filters, block, has_args, group, and prefix.
+            This function adds the CommandHandler to the CommandRouter of the given group.
+            The CommandHandler is created with the given command, filters, block, has_args,
+            and prefix.
 
             Args:
                 func: The function to call when the CommandHandler matches.
@@ -70,8 +112,8 @@ class TelegramHandler:
             Returns:
                 The function with the CommandHandler added to the Telegram Application.
             """
-            # Add the CommandHandler to the Telegram Application
-            self.app.add_handler(
+            # Add the CommandHandler to the group's CommandRouter
+            self._router(group, block).add_handler(
                 CommandHandler(
                     command,
                     func,
@@ -79,8 +121,8 @@ class TelegramHandler:
                     block=block,
                     has_args=has_args,
                     prefix=prefix,
-                ),
-                group,
+                    allow_edit=allow_edit,
+                )
             )
             return func
 
@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import telegram.ext as tg
@@ -8,13 +9,17 @@ from ptbmod.config import Config
 
 FilterDataDict = Dict[str, List[Any]]
 
+# Filter excluding edited messages and channel posts, shared by every NewMessageHandler
+_NO_EDITS = ~(filters_module.UpdateType.EDITED_MESSAGE | filters_module.UpdateType.EDITED_CHANNEL_POST)
+
 
 class NewCommandHandler(tg.CommandHandler):
     def __init__(
             self,
-            command: Union[str, list],
+            command: Union[str, List[str], Tuple[str, ...]],
             callback,
-            prefix: Optional[List] = None,
+            prefix: Optional[Union[List[str], Tuple[str, ...]]] = None,
+            allow_edit: bool = True,
             **kwargs,
     ) -> None:
         """
@@ -24,17 +29,24 @@ class NewCommandHandler(tg.CommandHandler):
             command: The command or list of commands this handler should listen for.
             callback: The function to call when this handler matches.
             prefix: The prefix to use for the command.
+            allow_edit: Whether the handler should be called for edited messages.
             **kwargs: Arbitrary keyword arguments.
         """
         if prefix is None:
             prefix = Config.HANDLER
         super().__init__(command, callback, **kwargs)
-        self.prefix = prefix
+        # Frozen as a tuple, which str.startswith checks against in C
+        self.prefix = tuple(prefix)
+        self._allow_edit = allow_edit
+        # First characters of the prefixes, for a cheap reject before any splitting
+        self._prefix_chars = frozenset(start[0] for start in self.prefix if start)
+        # Last seen bot username and its lowercase form, so it is lowered only once
+        self._bot_username: Optional[str] = None
+        self._bot_username_lower = ""
 
         if isinstance(command, str):
-            self.commands = frozenset({command.lower()})
-        else:
-            self.commands = frozenset(x.lower() for x in command)
+            command = (command,)
+        self.commands = frozenset(sys.intern(x.lower()) for x in command)
 
     def check_update(
             self, update: object
@@ -51,31 +63,44 @@ class NewCommandHandler(tg.CommandHandler):
         """
         # Check if the update is an Update and has an effective message
         if isinstance(update, Update) and update.effective_message:
+            # Skip edits up front instead of leaving them to the filters
+            if not self._allow_edit and update.edited_message is not None:
+                return None
+
             message = update.effective_message
 
-            # Check if the message has text and is longer than one character
-            if message.text and len(message.text) > 1:
+            text = message.text
+            # Most messages are not commands; reject them before splitting the text
+            if not text or text[0] not in self._prefix_chars:
+                return None
+
+            # Check if the message is longer than one character
+            if len(text) > 1:
                 # Split the message text into the first word and the rest
-                fst_word = message.text.split(sep=None, maxsplit=1)[0]
+                parts = text.split(sep=None, maxsplit=1)
+                fst_word = parts[0]
 
                 # Check if the first word starts with one of the prefixes
-                if len(fst_word) > 1 and any(fst_word.startswith(start) for start in self.prefix):
+                if len(fst_word) > 1 and fst_word.startswith(self.prefix):
                     # Split the first word into the command and the bot name
-                    command_parts = fst_word[1:].split("@")
-                    # Add the bot name to the end of the command parts
-                    command_parts.append(message.get_bot().username)
+                    command, sep, target = fst_word[1:].partition("@")
 
                     # Check if the command is one of the commands this handler should listen for
-                    # and if the bot name matches this bot's username
-                    if (
-                            command_parts[0].lower() not in self.commands
-                            or command_parts[1].lower() != message.get_bot().username.lower()
-                    ):
-                        # If not, return None
+                    # Most clients send lowercase commands; skip the lower() copy for those
+                    if (command if command.islower() else command.lower()) not in self.commands:
                         return None
 
-                    # Split the rest of the message into the args
-                    args = message.text.split()[1:]
+                    # If a bot name was given, check that it matches this bot's username
+                    if sep:
+                        bot_username = message.get_bot().username
+                        if bot_username != self._bot_username:
+                            self._bot_username = bot_username
+                            self._bot_username_lower = bot_username.lower()
+                        if target.lower() != self._bot_username_lower:
+                            return None
+
+                    # Split the rest of the message into the args, reusing the first split
+                    args = parts[1].split() if len(parts) > 1 else []
 
                     # Check if the args are correct
                     if not self._check_correct_args(args):
@@ -92,6 +117,87 @@ class NewCommandHandler(tg.CommandHandler):
         return None
 
 
+class CommandRouter(tg.BaseHandler):
+    """
+    A single handler that dispatches to many NewCommandHandlers by command name.
+
+    PTB calls check_update on every handler of a group in turn. Registering one router
+    per group instead of one handler per command turns that scan into a dict lookup.
+    """
+
+    def __init__(self, block: Optional[bool] = True) -> None:
+        """
+        Initialize a CommandRouter.
+
+        Args:
+            block: Whether the handler should block other handlers from being called.
+        """
+        super().__init__(self._unused_callback, block=block)
+        self.table: Dict[str, List[NewCommandHandler]] = {}
+        self._prefix_chars: frozenset = frozenset()
+
+    @staticmethod
+    async def _unused_callback(update: object, context: Any) -> None:
+        # handle_update always delegates to the matched handler's callback
+        raise RuntimeError("CommandRouter has no callback of its own")
+
+    def add_handler(self, handler: NewCommandHandler) -> None:
+        """
+        Register a NewCommandHandler under each of its commands.
+
+        Args:
+            handler: The handler to dispatch to. Handlers for the same command are tried
+                in the order they were added.
+        """
+        for command in handler.commands:
+            self.table.setdefault(command, []).append(handler)
+        self._prefix_chars |= handler._prefix_chars
+
+    def check_update(
+            self, update: object
+    ) -> Optional[Tuple[NewCommandHandler, Tuple[List[str], Optional[Union[bool, FilterDataDict]]]]]:
+        """
+        Determines whether an update should be handled by one of the routed handlers.
+
+        Args:
+            update: The incoming update.
+
+        Returns:
+            A tuple of the matching handler and its check result, or None if no routed
+            handler should handle the update.
+        """
+        if not isinstance(update, Update) or not update.effective_message:
+            return None
+
+        text = update.effective_message.text
+        if not text or text[0] not in self._prefix_chars:
+            return None
+
+        command = text.split(sep=None, maxsplit=1)[0][1:].partition("@")[0]
+        handlers = self.table.get(command if command.islower() else command.lower())
+        if handlers is None:
+            return None
+
+        for handler in handlers:
+            # The handler re-checks prefix, bot name, args and filters for this update
+            if check_result := handler.check_update(update):
+                return handler, check_result
+        return None
+
+    async def handle_update(
+            self,
+            update: Update,
+            application: Any,
+            check_result: Tuple[NewCommandHandler, Any],
+            context: Any,
+    ) -> Any:
+        """
+        Hand the update over to the handler that matched it in check_update.
+        """
+        handler, handler_result = check_result
+        return await handler.handle_update(update, application, handler_result, context)
+
+
 class NewMessageHandler(tg.MessageHandler):
     def __init__(
             self,
@@ -110,9 +216,7 @@ class NewMessageHandler(tg.MessageHandler):
         allow_edit: Whether the handler should be called for edited messages.
         """
         super().__init__(filters, callback, block=block)
-        if allow_edit is False:
-            # If allow_edit is False, remove the filters for edited messages
-            self.filters &= ~(
-                    filters_module.UpdateType.EDITED_MESSAGE
-                    | filters_module.UpdateType.EDITED_CHANNEL_POST
-            )
+        if not allow_edit:
+            # If allow_edit is False, remove the filters for edited messages.
+            # Without user filters there is nothing to AND with, so use _NO_EDITS as is.
+            self.filters = _NO_EDITS if filters is None else self.filters & _NO_EDITS